@@ -6,6 +6,7 @@ import string
 import data_visualization
 
 import coverage
+import coverage.python
 cov=coverage.Coverage()
 cov.start()
 
@@ -18,7 +19,8 @@ param_list = []
 cov_list = []
 cov_dict = {}
 prev_cov_dict = {}
-main_lists = []
+cov_cache = {}
+statements = None
 run_data = []
 n = 10
 de_max = 50
@@ -39,6 +41,15 @@ def de():
             print "*"*40
             print cov_dict
             break
+    # html is only for a human to look at, so render it once at the end.
+    # generator() skips cached sublists, so measure the final frontier
+    # afresh rather than report whichever sublist it measured last
+    cov.erase()
+    cov.start()
+    for params in basefrontier:
+        check_em_too(randomword(params[0]), randomword(params[1]),randomword(params[2]), randomword(params[3]))
+    cov.stop()
+    cov.html_report()
     visualizeData()
     print "Final frontier is:"      
     print basefrontier
@@ -52,40 +63,32 @@ def update(frnt):
         patience -= 1
     for i,x in enumerate(frnt):
         newx = extrapolate(frnt,x,f,cf)
-        frnt[i] = better(x,newx)
+        frnt[i] = better(i,x,newx)
     return frnt
 
 def extrapolate(frnt,one,f,cf):
     two,three,four = threeOthers(frnt,one)
-    new = [0]*len(one)
-    for i in range(len(one)):
-        x,y,z = two[i],three[i],four[i]
-        if random.random() < cf:
-            tmp = int(x + f*(y - z))
-            new[i] = trim(tmp)
+    rand = random.random
+    new = []
+    for x,y,z,old in zip(two,three,four,one):
+        if rand() < cf:
+            # trim to 1..40 inline, saves a call per parameter
+            new.append(max(1, min(int(x + f*(y - z)), 40)))
         else:
-            new[i] = one[i]     
+            new.append(old)
     return tuple(new)
 
+# words are random windows into one pool of letters drawn at import,
+# so each call is a single slice instead of a choice() per character
+word_pool = ''.join(random.choice(string.lowercase) for i in range(4096))
+
 def randomword(length):
-   a = ''.join(random.choice(string.lowercase) for i in range(length))
-   return a
+   start = random.randint(0, len(word_pool) - length)
+   return word_pool[start:start+length]
    
-def trim(x):
-    return max(1, min(x,40))
-    
-def better(x,new):
-    x_list = 0
-    list_coverage = 0
-    for i,some_list in enumerate(main_lists):
-        if x in some_list:
-            x_list = i
-            break
-    global cov_dict
-    list_coverage = cov_dict[x_list]
-    if list_coverage > 0.85:
-        return x
-    return new
+def better(i,x,new):
+    # sublists are contiguous slices of n, so the block is just i // n
+    return x if cov_dict.get(i // n,0) > 0.85 else new
         
 
 def threeOthers(frnt,avoid):
@@ -121,24 +124,37 @@ def test_de():
     de()
     
 def generator(current_frontier):
-    global cov_dict,prev_cov_dict,run_data
+    global cov_dict,prev_cov_dict,run_data,statements
     mean = 0
     maj_cnt = 0
     prev_cov_dict = cov_dict.copy()
     main_lists = [current_frontier[i:i+n] for i in range(0,len(current_frontier),n)]
     
     for i,sub_list in enumerate(main_lists):
-        cov.erase()
-        cov.start()
-        for params in sub_list:
-            check_em_too(randomword(params[0]), randomword(params[1]),randomword(params[2]), randomword(params[3]))
-        cov.stop()
-        cov.html_report()
-        dict = cov.analysis2('test_maincode_str.py')
-        totLines = dict[1]
-        msdLines = dict[3]
-        linesExe = len(totLines) - len(msdLines)
-        linesExePc = (float)(linesExe)/ len(totLines)
+        # check_em_too only branches on word lengths, so a sublist we have
+        # already measured covers the same lines again
+        key = tuple(sub_list)
+        if key in cov_cache:
+            linesExePc = cov_cache[key]
+        else:
+            cov.erase()
+            cov.start()
+            for params in sub_list:
+                check_em_too(randomword(params[0]), randomword(params[1]),randomword(params[2]), randomword(params[3]))
+            cov.stop()
+            if statements is None:
+                # the statement list never changes, so analyse the file once
+                # and afterwards just read the executed lines from the data.
+                # translate_lines() maps them to statement lines the same
+                # way analysis2 does (multi-line statements count once)
+                dict = cov.analysis2('test_maincode_str.py')
+                reporter = coverage.python.PythonFileReporter(dict[0], cov)
+                statements = (dict[0], set(dict[1]), reporter)
+            fname, totLines, reporter = statements
+            executed = reporter.translate_lines(cov.get_data().lines(fname) or ())
+            linesExe = len(totLines.intersection(executed))
+            linesExePc = (float)(linesExe)/ len(totLines)
+            cov_cache[key] = linesExePc
         cov_list.append(linesExePc)
         cov_dict[i] = linesExePc
         if linesExePc > 0.75: